@@ -5,18 +5,28 @@ Optimized for free hosting on Render, Railway, or Hugging Face Spaces
 """
 
 import os
+import functools
+import threading
+from concurrent.futures import Future
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, Input, Output, State, Patch
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
+from flask_compress import Compress
 import pandas as pd
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
 import hashlib
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
+
+# Serialize figures and Dash callback responses with orjson
+pio.json.config.default_engine = 'orjson'
 
 # Get port from environment variable (for cloud deployment)
 port = int(os.environ.get("PORT", 8050))
@@ -26,15 +36,70 @@ DEFAULT_LAT = float(os.environ.get("DEFAULT_LAT", 53.55))
 DEFAULT_LON = float(os.environ.get("DEFAULT_LON", 9.99))
 DEFAULT_ZOOM = 10
 
+# Line traces longer than this are downsampled before plotting
+MAX_CHART_POINTS = int(os.environ.get("MAX_CHART_POINTS", 300))
+
 # Use temporary directory for cloud deployments
 CACHE_DIR = Path(os.environ.get("CACHE_DIR", "/tmp/cache_dwd_data"))
 CACHE_DIR.mkdir(exist_ok=True)
 
+class WeatherBasis(NamedTuple):
+    """Time-of-day and seasonal-progress arrays shared by the demo series"""
+    hour_of_day: np.ndarray
+    sin_daily: np.ndarray
+    sin_progress: np.ndarray
+    sin_progress2: np.ndarray
+    sin_progress15: np.ndarray
+
+@functools.lru_cache(maxsize=8)
+def _basis(n_hours: int, first_hour: int) -> WeatherBasis:
+    """Deterministic sinusoidal basis for an hourly range, computed once per shape"""
+    hour_of_day = ((first_hour + np.arange(n_hours)) % 24).astype(np.int8)
+    two_pi_progress = 2 * np.pi * np.arange(n_hours) / n_hours
+    basis = WeatherBasis(
+        hour_of_day=hour_of_day,
+        sin_daily=np.sin(2 * np.pi * (hour_of_day - 6) / 24),
+        sin_progress=np.sin(two_pi_progress),
+        sin_progress2=np.sin(two_pi_progress * 2),
+        sin_progress15=np.sin(two_pi_progress * 1.5),
+    )
+    
+    # Cached arrays are shared between calls, so guard them against mutation
+    for arr in basis:
+        arr.setflags(write=False)
+    return basis
+
+class Station(NamedTuple):
+    """Nearest-station lookup result"""
+    station_id: str
+    name: str
+    height: float
+    distance_km: float
+
 class DWDDataFetcher:
     """Simplified DWD data fetcher for web deployment"""
     
     def __init__(self):
+        self.session = self.create_session()
         self.stations_df = self.get_default_stations()
+        
+        # Plain column arrays for fast lookups
+        self._ids = self.stations_df['station_id'].to_numpy()
+        self._names = self.stations_df['name'].to_numpy()
+        self._heights = self.stations_df['height'].to_numpy()
+        self._station_coords = self.stations_df[['lat', 'lon']].to_numpy()
+    
+    def create_session(self) -> requests.Session:
+        """Create a keep-alive HTTP session with connection pooling and retries"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(500, 502, 503, 504))
+        )
+        session.mount('https://', adapter)
+        return session
     
     def get_default_stations(self):
         """Return default stations for demo"""
@@ -48,138 +113,369 @@ class DWDDataFetcher:
             {'station_id': '01757', 'name': 'Kiel-Holtenau', 'lat': 54.3774, 'lon': 10.1424, 'height': 27},
         ])
     
-    def find_nearest_station(self, lat: float, lon: float) -> Dict:
+    def find_nearest_station(self, lat: float, lon: float) -> Optional[Station]:
         """Find nearest weather station"""
         if self.stations_df.empty:
             return None
         
-        distances = np.sqrt((self.stations_df['lat'] - lat)**2 + 
-                          (self.stations_df['lon'] - lon)**2)
-        nearest_idx = distances.idxmin()
-        station = self.stations_df.loc[nearest_idx].to_dict()
-        station['distance_km'] = distances[nearest_idx] * 111
-        return station
-    
-    def generate_weather_data(self, station_id: str, hours: int = 72) -> Dict[str, pd.DataFrame]:
-        """Generate realistic demo weather data"""
+        # Squared distances on the precomputed coordinate array
+        sq_distances = ((self._station_coords - (lat, lon))**2).sum(axis=1)
+        nearest_idx = int(sq_distances.argmin())
+        return Station(
+            station_id=self._ids[nearest_idx],
+            name=self._names[nearest_idx],
+            height=float(self._heights[nearest_idx]),
+            distance_km=float(np.sqrt(sq_distances[nearest_idx]) * 111)
+        )
+    
+    def generate_weather_data(self, station_id: str, hours: int = 72,
+                              seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Generate realistic demo weather data as aligned float32 column arrays"""
         end_date = datetime.now()
         start_date = end_date - timedelta(hours=hours)
         date_range = pd.date_range(start=start_date, end=end_date, freq='H')
         n_hours = len(date_range)
         
-        # Create realistic patterns
-        hour_of_day = np.array([d.hour for d in date_range])
-        day_progress = np.arange(n_hours) / n_hours
+        # Create realistic patterns (only date_range depends on the clock)
+        basis = _basis(n_hours, date_range[0].hour)
+        hour_of_day = basis.hour_of_day
         
-        data = {}
+        # Draw all random samples up front from a single generator
+        rng = np.random.default_rng(seed)
+        noise = rng.standard_normal((3, n_hours), dtype=np.float32)  # temp, wind, cloud
+        rain_draw = rng.random(n_hours, dtype=np.float32)
+        rain_amount = rng.standard_exponential(n_hours, dtype=np.float32) * 2
+        cloud_factor = rng.beta(2, 5, n_hours).astype(np.float32)
+        
+        data = {'datetime': date_range.values}
         
         # Temperature with daily cycle
-        base_temp = 12 + 8 * np.sin(2 * np.pi * day_progress)
-        daily_cycle = 5 * np.sin(2 * np.pi * (hour_of_day - 6) / 24)
-        data['temperature'] = pd.DataFrame({
-            'datetime': date_range,
-            'temperature_c': base_temp + daily_cycle + np.random.normal(0, 1, n_hours)
-        })
+        base_temp = 12 + 8 * basis.sin_progress
+        daily_cycle = 5 * basis.sin_daily
+        temperature = base_temp + daily_cycle + noise[0]
+        data['temperature_c'] = temperature.astype(np.float32, copy=False)
         
         # Precipitation (intermittent)
-        rain_events = np.random.random(n_hours) < 0.2
-        data['precipitation'] = pd.DataFrame({
-            'datetime': date_range,
-            'precipitation_mm': np.where(rain_events, np.random.exponential(2, n_hours), 0)
-        })
+        rain_events = rain_draw < 0.2
+        precipitation = np.where(rain_events, rain_amount, 0)
+        data['precipitation_mm'] = precipitation.astype(np.float32, copy=False)
         
         # Wind
-        data['wind'] = pd.DataFrame({
-            'datetime': date_range,
-            'wind_speed_ms': 8 + 4 * np.sin(2 * np.pi * day_progress * 2) + np.random.normal(0, 2, n_hours)
-        })
+        wind_speed = 8 + 4 * basis.sin_progress2 + 2 * noise[1]
+        data['wind_speed_ms'] = wind_speed.astype(np.float32, copy=False)
         
         # Sunshine
         daylight = (hour_of_day >= 6) & (hour_of_day <= 20)
-        cloud_factor = np.random.beta(2, 5, n_hours)
-        data['sunshine'] = pd.DataFrame({
-            'datetime': date_range,
-            'sunshine_minutes': np.where(daylight, 60 * (1 - cloud_factor), 0)
-        })
+        sunshine = np.where(daylight, 60 * (1 - cloud_factor), 0)
+        data['sunshine_minutes'] = sunshine.astype(np.float32, copy=False)
         
         # Cloud cover
-        data['cloudiness'] = pd.DataFrame({
-            'datetime': date_range,
-            'cloud_cover_oktas': 4 + 3 * np.sin(2 * np.pi * day_progress * 1.5) + np.random.normal(0, 1, n_hours)
-        })
+        cloud_cover = 4 + 3 * basis.sin_progress15 + noise[2]
+        data['cloud_cover_oktas'] = cloud_cover.astype(np.float32, copy=False)
         
         return data
 
+# SSI score components and their weights, in kernel row order
+SSI_SCORE_COLS = ('temp_score', 'precip_score', 'wind_score', 'sun_score', 'cloud_score')
+SSI_WEIGHTS = np.array([0.15, 0.35, 0.30, 0.10, 0.10], dtype=np.float32)
+
+def _ssi_kernel(temp: np.ndarray, precip: np.ndarray, wind: np.ndarray,
+                sun: np.ndarray, cloud: np.ndarray):
+    """Score weather arrays into a (5, n) score matrix and the weighted SSI"""
+    scores = np.empty((len(SSI_SCORE_COLS), len(temp)), dtype=np.float32)
+    
+    # Temperature score
+    temp_bands = [
+        (temp >= 15) & (temp <= 25),
+        (temp >= 10) & (temp <= 30),
+        (temp >= 5) & (temp <= 35),
+    ]
+    scores[0] = np.select(temp_bands, [100, 75, 50], default=25)
+    
+    # Linear scores are evaluated in place in their rows, without temporaries
+    
+    # Precipitation score: clip(100 - precip * 10, 0, 100)
+    row = scores[1]
+    np.multiply(precip, -10, out=row)
+    row += 100
+    np.clip(row, 0, 100, out=row)
+    
+    # Wind score: clip(100 - (wind - 5) * 6.67, 0, 100)
+    row = scores[2]
+    np.subtract(wind, 5, out=row)
+    row *= -6.67
+    row += 100
+    np.clip(row, 0, 100, out=row)
+    
+    # Sunshine score: 25 + (sun / 60) * 75
+    row = scores[3]
+    np.multiply(sun, 75 / 60, out=row)
+    row += 25
+    
+    # Cloud score: 100 - (clip(cloud, 0, 8) / 8) * 75
+    row = scores[4]
+    np.clip(cloud, 0, 8, out=row)
+    row *= -75 / 8
+    row += 100
+    
+    # Weighted SSI as a single vector-matrix product
+    return scores, SSI_WEIGHTS @ scores
+
 class WeatherAnalyzer:
     """Weather analysis for survey suitability"""
     
+    # SSI category thresholds and their labels/colors
+    SSI_BINS = np.array([40, 70])
+    SSI_CATEGORIES = np.array(['Poor', 'Moderate', 'Good'])
+    SSI_COLORS = np.array(['#FF4444', '#FFA500', '#44FF44'])
+    
     @staticmethod
-    def calculate_ssi(weather_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    def calculate_ssi(weather_data: Dict[str, np.ndarray]) -> pd.DataFrame:
         """Calculate Survey Suitability Index"""
         
-        # Merge all data
-        merged = weather_data['temperature'].set_index('datetime')
-        for key, df in weather_data.items():
-            if key != 'temperature':
-                merged = merged.join(df.set_index('datetime'), rsuffix=f'_{key}')
-        
-        scores = pd.DataFrame(index=merged.index)
-        
-        # Temperature score
-        temp = merged['temperature_c']
-        scores['temp_score'] = np.where(
-            (temp >= 15) & (temp <= 25), 100,
-            np.where((temp >= 10) & (temp <= 30), 75,
-            np.where((temp >= 5) & (temp <= 35), 50, 25))
+        # Arrays come from the same date range, so no merge is needed
+        score_matrix, ssi = _ssi_kernel(
+            weather_data['temperature_c'],
+            weather_data['precipitation_mm'],
+            weather_data['wind_speed_ms'],
+            weather_data['sunshine_minutes'],
+            weather_data['cloud_cover_oktas']
         )
+        scores = dict(zip(SSI_SCORE_COLS, score_matrix))
+        scores['SSI'] = ssi
         
-        # Precipitation score
-        precip = merged['precipitation_mm']
-        scores['precip_score'] = np.clip(100 - precip * 10, 0, 100)
-        
-        # Wind score
-        wind = merged['wind_speed_ms']
-        scores['wind_score'] = np.clip(100 - (wind - 5) * 6.67, 0, 100)
+        # Bucket into (0, 40], (40, 70], (70, 100]
+        category_idx = np.digitize(ssi, WeatherAnalyzer.SSI_BINS, right=True)
+        scores['category'] = WeatherAnalyzer.SSI_CATEGORIES[category_idx]
+        scores['color'] = WeatherAnalyzer.SSI_COLORS[category_idx]
         
-        # Sunshine score
-        sun = merged['sunshine_minutes']
-        scores['sun_score'] = 25 + (sun / 60) * 75
-        
-        # Cloud score
-        cloud = merged['cloud_cover_oktas'].clip(0, 8)
-        scores['cloud_score'] = 100 - (cloud / 8) * 75
-        
-        # Calculate weighted SSI
-        weights = {
-            'temp_score': 0.15,
-            'precip_score': 0.35,
-            'wind_score': 0.30,
-            'sun_score': 0.10,
-            'cloud_score': 0.10
-        }
+        # Wrap in a DataFrame only for the final result
+        return pd.DataFrame({'datetime': weather_data['datetime'], **scores})
+
+# Initialize components
+data_fetcher = DWDDataFetcher()
+weather_analyzer = WeatherAnalyzer()
+
+def share_inflight(func):
+    """Let concurrent calls with the same arguments wait on one running call"""
+    inflight: Dict[tuple, Future] = {}
+    lock = threading.Lock()
+    
+    @functools.wraps(func)
+    def wrapper(*args):
+        with lock:
+            future = inflight.get(args)
+            is_owner = future is None
+            if is_owner:
+                future = inflight[args] = Future()
         
-        scores['SSI'] = sum(scores[col] * weights[col] for col in weights.keys())
+        if not is_owner:
+            return future.result()
         
-        scores['category'] = pd.cut(scores['SSI'], 
-                                   bins=[0, 40, 70, 100],
-                                   labels=['Poor', 'Moderate', 'Good'])
+        try:
+            result = func(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with lock:
+                del inflight[args]
+    
+    return wrapper
+
+def refresh_bucket(n_clicks: Optional[int]) -> tuple:
+    """Cache key that changes on every refresh click and at the top of each hour"""
+    return (n_clicks or 0, datetime.now().strftime('%Y%m%d%H'))
+
+def data_seed(station_id: str, hours: int, bucket: tuple) -> int:
+    """Stable demo data seed, identical across workers for the same cache key"""
+    digest = hashlib.sha256(f"{station_id}:{hours}:{bucket}".encode()).digest()
+    return int.from_bytes(digest[:4], 'little')
+
+def get_station_data(station_id: str, hours: int, seed: Optional[int] = None):
+    """Generate demo weather data and its SSI"""
+    weather_data = data_fetcher.generate_weather_data(station_id, hours, seed)
+    ssi_data = weather_analyzer.calculate_ssi(weather_data)
+    return weather_data, ssi_data
+
+def lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out indices of an evenly spaced series (Largest-Triangle-Three-Buckets)"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest is split into buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
         
-        scores['color'] = scores['category'].map({
-            'Poor': '#FF4444',
-            'Moderate': '#FFA500', 
-            'Good': '#44FF44'
-        })
+        # Average point of the next bucket (or the last point)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = n - 1, y[n - 1]
         
-        return scores.reset_index()
+        # Keep the point forming the largest triangle with a and the average
+        candidates = np.arange(start, end)
+        areas = np.abs((a - avg_x) * (y[start:end] - y[a]) -
+                       (a - candidates) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+    
+    return indices
 
-# Initialize components
-data_fetcher = DWDDataFetcher()
-weather_analyzer = WeatherAnalyzer()
+def downsample(x: np.ndarray, y: np.ndarray, n_out: int = MAX_CHART_POINTS):
+    """Downsample a line trace with LTTB, keeping its visual shape"""
+    idx = lttb_indices(y, n_out)
+    return x[idx], y[idx]
+
+def to_figure_json(fig: go.Figure) -> Dict:
+    """Serialize a figure once so callbacks can return a plain JSON dict"""
+    return json.loads(pio.to_json(fig))
+
+def build_map_template(stations_df: pd.DataFrame) -> Dict:
+    """Map figure with station markers and a placeholder selected-location marker"""
+    fig = go.Figure()
+    
+    # Add station markers
+    fig.add_trace(go.Scattermapbox(
+        lat=stations_df['lat'],
+        lon=stations_df['lon'],
+        mode='markers',
+        marker=dict(size=8, color='lightblue'),
+        text=stations_df['name'],
+        hovertemplate='<b>%{text}</b><br>Lat: %{lat:.2f}<br>Lon: %{lon:.2f}<extra></extra>',
+        name='Stations'
+    ))
+    
+    # Add selected location
+    fig.add_trace(go.Scattermapbox(
+        lat=[DEFAULT_LAT],
+        lon=[DEFAULT_LON],
+        mode='markers',
+        marker=dict(size=15, color='red'),
+        text=['Selected AOI'],
+        name='Selected'
+    ))
+    
+    fig.update_layout(
+        mapbox=dict(
+            style='open-street-map',
+            center=dict(lat=DEFAULT_LAT, lon=DEFAULT_LON),
+            zoom=DEFAULT_ZOOM
+        ),
+        margin=dict(l=0, r=0, t=0, b=0),
+        showlegend=True
+    )
+    
+    return to_figure_json(fig)
+
+def build_ssi_template() -> Dict:
+    """SSI figure with layout and threshold lines but no data"""
+    ssi_fig = go.Figure()
+    ssi_fig.add_trace(go.Scattergl(
+        x=[],
+        y=[],
+        mode='lines',
+        line=dict(width=3, color='#3498db'),
+        fill='tozeroy',
+        fillcolor='rgba(52, 152, 219, 0.2)',
+        name='SSI'
+    ))
+    
+    ssi_fig.add_hline(y=70, line_dash="dash", line_color="green", 
+                     annotation_text="Good")
+    ssi_fig.add_hline(y=40, line_dash="dash", line_color="orange", 
+                     annotation_text="Moderate")
+    
+    ssi_fig.update_layout(
+        xaxis_title="Time",
+        yaxis_title="Survey Suitability Index",
+        yaxis=dict(range=[0, 100]),
+        margin=dict(l=40, r=20, t=20, b=40),
+        hovermode='x unified'
+    )
+    
+    return to_figure_json(ssi_fig)
+
+def build_weather_template() -> Dict:
+    """Weather parameter subplots with empty traces"""
+    weather_fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('Temperature (°C)', 'Wind Speed (m/s)',
+                       'Precipitation (mm/h)', 'Sunshine (min/h)'),
+        vertical_spacing=0.15
+    )
+    
+    # Temperature
+    weather_fig.add_trace(
+        go.Scattergl(x=[], y=[],
+                  mode='lines', line=dict(color='red'), name='Temp'),
+        row=1, col=1
+    )
+    
+    # Wind
+    weather_fig.add_trace(
+        go.Scattergl(x=[], y=[],
+                  mode='lines', line=dict(color='green'), name='Wind'),
+        row=1, col=2
+    )
+    
+    # Precipitation
+    weather_fig.add_trace(
+        go.Bar(x=[], y=[],
+              marker_color='blue', name='Rain'),
+        row=2, col=1
+    )
+    
+    # Sunshine
+    weather_fig.add_trace(
+        go.Bar(x=[], y=[],
+              marker_color='gold', name='Sun'),
+        row=2, col=2
+    )
+    
+    weather_fig.update_layout(
+        showlegend=False,
+        height=400,
+        margin=dict(l=40, r=20, t=40, b=40)
+    )
+    
+    return to_figure_json(weather_fig)
+
+def patch_traces(traces: List[tuple]) -> Patch:
+    """Patch only the x/y arrays of a figure's traces, in trace order"""
+    patch = Patch()
+    for i, (x, y) in enumerate(traces):
+        patch['data'][i]['x'] = x
+        patch['data'][i]['y'] = y
+    return patch
+
+# Figures are built and serialized once; callbacks only patch their data
+MAP_TEMPLATE = build_map_template(data_fetcher.stations_df)
+SSI_TEMPLATE = build_ssi_template()
+WEATHER_TEMPLATE = build_weather_template()
 
 # Create Dash app
 app = dash.Dash(__name__)
 server = app.server  # Expose server for deployment
 
+# Compress responses; moderate level keeps CPU low on free-tier hosts
+server.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+server.config['COMPRESS_LEVEL'] = 4
+server.config['COMPRESS_BR_LEVEL'] = 4
+server.config['COMPRESS_MIN_SIZE'] = 500
+Compress(server)
+
 app.layout = html.Div([
     # Header
     html.Div([
@@ -195,6 +491,7 @@ app.layout = html.Div([
         html.Div([
             dcc.Graph(
                 id='aoi-map',
+                figure=MAP_TEMPLATE,
                 style={'height': '400px'},
                 config={'displayModeBar': False}
             ),
@@ -229,12 +526,12 @@ app.layout = html.Div([
         html.Div([
             html.Div([
                 html.H3('📈 Survey Suitability Index'),
-                dcc.Graph(id='ssi-chart', style={'height': '250px'})
+                dcc.Graph(id='ssi-chart', figure=SSI_TEMPLATE, style={'height': '250px'})
             ]),
             
             html.Div([
                 html.H3('🌡️ Weather Parameters'),
-                dcc.Graph(id='weather-chart', style={'height': '400px'})
+                dcc.Graph(id='weather-chart', figure=WEATHER_TEMPLATE, style={'height': '400px'})
             ], style={'marginTop': '20px'})
             
         ], style={'width': '58%', 'display': 'inline-block', 'padding': '10px'})
@@ -260,40 +557,11 @@ def update_map(clickData, current_location):
         if 'lat' in point and 'lon' in point:
             lat, lon = point['lat'], point['lon']
     
-    stations_df = data_fetcher.stations_df
-    
-    fig = go.Figure()
-    
-    # Add station markers
-    fig.add_trace(go.Scattermapbox(
-        lat=stations_df['lat'],
-        lon=stations_df['lon'],
-        mode='markers',
-        marker=dict(size=8, color='lightblue'),
-        text=stations_df['name'],
-        hovertemplate='<b>%{text}</b><br>Lat: %{lat:.2f}<br>Lon: %{lon:.2f}<extra></extra>',
-        name='Stations'
-    ))
-    
-    # Add selected location
-    fig.add_trace(go.Scattermapbox(
-        lat=[lat],
-        lon=[lon],
-        mode='markers',
-        marker=dict(size=15, color='red'),
-        text=['Selected AOI'],
-        name='Selected'
-    ))
-    
-    fig.update_layout(
-        mapbox=dict(
-            style='open-street-map',
-            center=dict(lat=lat, lon=lon),
-            zoom=DEFAULT_ZOOM
-        ),
-        margin=dict(l=0, r=0, t=0, b=0),
-        showlegend=True
-    )
+    # Move the selected marker and recenter; station markers stay as-is
+    fig = Patch()
+    fig['data'][1]['lat'] = [lat]
+    fig['data'][1]['lon'] = [lon]
+    fig['layout']['mapbox']['center'] = {'lat': lat, 'lon': lon}
     
     return fig, {'lat': lat, 'lon': lon}
 
@@ -309,8 +577,8 @@ def update_location_info(location):
     
     if station:
         return html.Div([
-            html.H4(f"📍 {station['name']}"),
-            html.P(f"Distance: {station['distance_km']:.1f} km | Elevation: {station['height']:.0f} m")
+            html.H4(f"📍 {station.name}"),
+            html.P(f"Distance: {station.distance_km:.1f} km | Elevation: {station.height:.0f} m")
         ])
     
     return html.Div([
@@ -318,6 +586,29 @@ def update_location_info(location):
         html.P(f"Lat: {lat:.3f}°N, Lon: {lon:.3f}°E")
     ])
 
+@share_inflight
+@functools.lru_cache(maxsize=64)
+def get_chart_traces(station_id: str, hours: int, bucket: tuple):
+    """Build SSI and weather trace arrays, memoized per refresh bucket"""
+    
+    # Generate weather data and SSI
+    weather_data, ssi_data = get_station_data(
+        station_id, hours, data_seed(station_id, hours, bucket)
+    )
+    
+    # Downsample line traces for long time ranges
+    ssi_traces = [
+        downsample(ssi_data['datetime'].to_numpy(), ssi_data['SSI'].to_numpy()),
+    ]
+    weather_traces = [
+        downsample(weather_data['datetime'], weather_data['temperature_c']),
+        downsample(weather_data['datetime'], weather_data['wind_speed_ms']),
+        (weather_data['datetime'], weather_data['precipitation_mm']),
+        (weather_data['datetime'], weather_data['sunshine_minutes']),
+    ]
+    
+    return ssi_traces, weather_traces
+
 @app.callback(
     [Output('ssi-chart', 'figure'),
      Output('weather-chart', 'figure')],
@@ -332,90 +623,16 @@ def update_charts(location, n_clicks, hours):
     station = data_fetcher.find_nearest_station(lat, lon)
     
     if not station:
-        empty_fig = go.Figure()
-        return empty_fig, empty_fig
-    
-    # Generate weather data
-    weather_data = data_fetcher.generate_weather_data(
-        station['station_id'], 
-        int(hours)
-    )
-    
-    # Calculate SSI
-    ssi_data = weather_analyzer.calculate_ssi(weather_data)
-    
-    # SSI Chart
-    ssi_fig = go.Figure()
-    ssi_fig.add_trace(go.Scatter(
-        x=ssi_data['datetime'],
-        y=ssi_data['SSI'],
-        mode='lines',
-        line=dict(width=3, color='#3498db'),
-        fill='tozeroy',
-        fillcolor='rgba(52, 152, 219, 0.2)',
-        name='SSI'
-    ))
-    
-    ssi_fig.add_hline(y=70, line_dash="dash", line_color="green", 
-                     annotation_text="Good")
-    ssi_fig.add_hline(y=40, line_dash="dash", line_color="orange", 
-                     annotation_text="Moderate")
-    
-    ssi_fig.update_layout(
-        xaxis_title="Time",
-        yaxis_title="Survey Suitability Index",
-        yaxis=dict(range=[0, 100]),
-        margin=dict(l=40, r=20, t=20, b=40),
-        hovermode='x unified'
-    )
-    
-    # Weather Parameters Chart
-    weather_fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Temperature (°C)', 'Wind Speed (m/s)',
-                       'Precipitation (mm/h)', 'Sunshine (min/h)'),
-        vertical_spacing=0.15
-    )
+        return SSI_TEMPLATE, WEATHER_TEMPLATE
     
-    # Temperature
-    weather_fig.add_trace(
-        go.Scatter(x=weather_data['temperature']['datetime'],
-                  y=weather_data['temperature']['temperature_c'],
-                  mode='lines', line=dict(color='red'), name='Temp'),
-        row=1, col=1
-    )
-    
-    # Wind
-    weather_fig.add_trace(
-        go.Scatter(x=weather_data['wind']['datetime'],
-                  y=weather_data['wind']['wind_speed_ms'],
-                  mode='lines', line=dict(color='green'), name='Wind'),
-        row=1, col=2
-    )
-    
-    # Precipitation
-    weather_fig.add_trace(
-        go.Bar(x=weather_data['precipitation']['datetime'],
-              y=weather_data['precipitation']['precipitation_mm'],
-              marker_color='blue', name='Rain'),
-        row=2, col=1
-    )
-    
-    # Sunshine
-    weather_fig.add_trace(
-        go.Bar(x=weather_data['sunshine']['datetime'],
-              y=weather_data['sunshine']['sunshine_minutes'],
-              marker_color='gold', name='Sun'),
-        row=2, col=2
-    )
-    
-    weather_fig.update_layout(
-        showlegend=False,
-        height=400,
-        margin=dict(l=40, r=20, t=40, b=40)
+    # Trace data is cached until refresh; only the arrays are sent
+    ssi_traces, weather_traces = get_chart_traces(
+        station.station_id,
+        int(hours),
+        refresh_bucket(n_clicks)
     )
     
-    return ssi_fig, weather_fig
+    return patch_traces(ssi_traces), patch_traces(weather_traces)
 
 if __name__ == '__main__':
     # For local testing